@@ -11,10 +11,16 @@ Improvements in V2:
 Dataset: guess-the-animal-dataset.xlsx with 4 sheets (Dogs/Cats/Horses/Dinosaurs)
 """
 
+import gc
 import random
-import pandas as pd
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 import gradio as gr
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 # ----------------------------
 # Dataset configuration
 # ----------------------------
@@ -41,16 +47,35 @@ ANSWER_FIELD = {
 MAX_CLUES = 3
 
 # ----------------------------
-# Load data at startup
+# Load data on first use
 # ----------------------------
 
-def _load_and_clean_sheet(sheet_name: str) -> pd.DataFrame:
-    """Load Excel sheet and remove unnamed columns."""
-    df = pd.read_excel(XLSX_PATH, sheet_name=sheet_name)
-    df = df.loc[:, ~df.columns.astype(str).str.contains("^Unnamed", na=False)]
+def _load_and_clean_sheet(workbook: "pd.ExcelFile", sheet_name: str) -> "pd.DataFrame":
+    """Parse one sheet from the open workbook and remove unnamed columns."""
+    df = workbook.parse(sheet_name)
+    df = df.drop(columns=[c for c in df.columns if isinstance(c, str) and c.startswith("Unnamed")])
     return df
 
-DECKS = {category: _load_and_clean_sheet(sheet) for category, sheet in SHEETS.items()}
+def load_decks() -> dict[str, "pd.DataFrame"]:
+    """
+    Load every category sheet from the workbook.
+    pandas and the Excel reader are imported here so the UI can start
+    without paying for them; the first New Round absorbs the parse.
+    Only get_deck_tables() calls this, and it keeps just the derived tables.
+    """
+    import pandas as pd
+
+    # Prefer the Rust-backed calamine reader; fall back to openpyxl in streaming mode
+    try:
+        import python_calamine  # noqa: F401
+        engine, engine_kwargs = "calamine", None
+    except ImportError:
+        engine = "openpyxl"
+        engine_kwargs = {"read_only": True, "data_only": True, "keep_links": False}
+
+    # Open the workbook once and parse every sheet from it
+    with pd.ExcelFile(XLSX_PATH, engine=engine, engine_kwargs=engine_kwargs) as workbook:
+        return {category: _load_and_clean_sheet(workbook, sheet) for category, sheet in SHEETS.items()}
 
 # ----------------------------
 # Helper utilities
@@ -64,13 +89,12 @@ def safe_str(x) -> str:
     """Convert value to string, handling NaN/None gracefully."""
     if x is None:
         return ""
-    try:
-        if pd.isna(x):
-            return ""
-    except Exception:
-        pass
+    if isinstance(x, float) and x != x:  # NaN is the only value not equal to itself
+        return ""
     return str(x).strip()
 
+ICON = {"Dogs": "🐶", "Cats": "🐱", "Horses": "🐴", "Dinosaurs": "🦖"}
+
 def build_score_text(state: dict | None) -> str:
     """Create HUD-style score display."""
     # score = state.get("score", 0)
@@ -78,25 +102,74 @@ def build_score_text(state: dict | None) -> str:
     # cat = state.get("category", "—")
     # return f"**Category:** {cat} &nbsp;&nbsp;|&nbsp;&nbsp; **Score:** {score} &nbsp;&nbsp;|&nbsp;&nbsp; **Streak:** {streak}"
     state = state or {}
-    ICON = {"Dogs":"🐶", "Cats":"🐱", "Horses":"🐴", "Dinosaurs":"🦖"}
     cat = state.get("category", "—")
     icon = ICON.get(cat, "🧭")
     score = state.get("score", 0)
     streak = state.get("streak", 0)
     return f"**{icon} {cat}** &nbsp;&nbsp; **⭐ Score:** {score} &nbsp;&nbsp; **🔥 Streak:** {streak}"
 
+# ----------------------------
+# Precomputed per-category tables
+# ----------------------------
+
+def _build_answer_pool(answers) -> tuple[str, ...]:
+    """Clean answers, dropping blanks and case-insensitive duplicates (first spelling wins)."""
+    pool = {}
+    for answer in answers:
+        answer = safe_str(answer)
+        if answer:
+            pool.setdefault(answer.lower(), answer)
+    return tuple(pool.values())
+
+@lru_cache(maxsize=None)
+def get_deck_tables() -> dict[str, dict]:
+    """
+    Build static lookup tables for each category (once, on first call):
+    - rows: rows with a valid answer, as dicts of cleaned strings
+    - answer_pool: distinct answer strings used to draw distractors
+    - answer_index: lowercased answer -> its position in answer_pool
+    - clue_strings: per clue number, the fully rendered clue for each row
+      (parallel to rows, so a round only needs its row id)
+    """
+    decks = load_decks()
+    tables = {}
+    for category, df in decks.items():
+        answer_col = ANSWER_FIELD[category]
+        pool = _build_answer_pool(df[answer_col].dropna())
+        rows = [
+            {field: safe_str(value) for field, value in row.items()}
+            for row in df.dropna(subset=[answer_col]).to_dict("records")
+        ]
+        tables[category] = {
+            "rows": rows,
+            "clue_strings": [
+                [render_clue(category, clue_number, row) for row in rows]
+                for clue_number in range(1, MAX_CLUES + 1)
+            ],
+            "answer_pool": pool,
+            "answer_index": {answer.lower(): i for i, answer in enumerate(pool)},
+        }
+
+    # The DataFrames are not needed at runtime; release them and the reader's objects
+    del decks, df
+    gc.collect()
+    return tables
+
 def get_example_image(row: dict) -> str | None:
     """Extract image URL from row."""
-    url = safe_str(row.get(IMAGE_FIELD, ""))
-    return url or None
+    return row.get(IMAGE_FIELD) or None
 
+NO_IMAGE_HTML = "<p style='color: gray; text-align: center;'>No image available</p>"
+
+@lru_cache(maxsize=1024)
 def generate_image_html(img_url: str | None) -> str:
     """
     Generate HTML img tag for client-side image loading.
     Avoids Gradio's server-side download (which gets 403 from Wikimedia).
+    Cached per URL since each dataset row always renders the same markup.
     """
     if not img_url:
-        return "<p style='color: gray; text-align: center;'>No image available</p>"
+        return NO_IMAGE_HTML
 
     return f"""
     <div style="text-align: center; padding: 10px;">
@@ -108,13 +181,9 @@ def generate_image_html(img_url: str | None) -> str:
     </div>
     """
 
-def pick_round_row(category: str) -> dict:
-    """Select random row from category deck (must have valid answer)."""
-    df = DECKS[category].copy()
-    answer_col = ANSWER_FIELD[category]
-    df = df.dropna(subset=[answer_col])
-    row = df.sample(1).iloc[0].to_dict()
-    return row
+def pick_round_row(category: str) -> int:
+    """Select random row id (index into the category's rows and clue_strings)."""
+    return random.randrange(len(get_deck_tables()[category]["rows"]))
 
 def make_options(category: str, correct_answer: str, n_options: int = 4) -> list[str]:
     """
@@ -123,13 +192,14 @@ def make_options(category: str, correct_answer: str, n_options: int = 4) -> list
     - Shuffled randomly
     - Total of 4 options for clean single-row layout
     """
-    df = DECKS[category]
-    answer_col = ANSWER_FIELD[category]
+    tables = get_deck_tables()[category]
+    pool = tables["answer_pool"]
+    correct_idx = tables["answer_index"].get(correct_answer.lower())
 
-    candidates = [safe_str(x) for x in df[answer_col].dropna().tolist()]
-    candidates = [c for c in candidates if c and c.lower() != correct_answer.lower()]
+    # Draw one spare index in case the correct answer comes up, then drop it
+    picks = random.sample(range(len(pool)), k=min(n_options, len(pool)))
+    distractors = [pool[i] for i in picks if i != correct_idx][:n_options - 1]
 
-    distractors = random.sample(candidates, k=min(n_options - 1, len(candidates)))
     options = [correct_answer] + distractors
     random.shuffle(options)
     return options
@@ -138,93 +208,87 @@ def make_options(category: str, correct_answer: str, n_options: int = 4) -> list
 # Composite clue builder
 # ----------------------------
 
+# (category, clue_number) -> ((field, default), ...), template
+# Templates are filled positionally with the cleaned field values, in order.
+CLUE_SPECS = {
+    # DOGS: 1: Country, Continent, Creation Time, Use | 2: Color | 3: Personality Traits
+    ("Dogs", 1): (
+        (("Country", "unknown"), ("Continent", "unknown"), ("Creation Time", "unknown time"), ("Use", "various purposes")),
+        "**Clue 1:** This species was bred in {0}, {1} during the {2} for use(s) like {3}",
+    ),
+    ("Dogs", 2): (
+        (("Color", "various colors"),),
+        "**Clue 2:** This species is often found in colors: {0}",
+    ),
+    ("Dogs", 3): (
+        (("Personality Traits", "varied traits"),),
+        "**Clue 3:** Personality traits associated with the species are {0}",
+    ),
+
+    # CATS: 1: Country, Continent, History | 2: Color | 3: Personality
+    ("Cats", 1): (
+        (("Country", "unknown"), ("Continent", "unknown"), ("History", "unknown history")),
+        "**Clue 1:** This species was bred in {0}, {1} and a tidbit of its history: {2}",
+    ),
+    ("Cats", 2): (
+        (("Color", "various colors"),),
+        "**Clue 2:** This species is often found in colors: {0}",
+    ),
+    ("Cats", 3): (
+        (("Personality", "varied traits"),),
+        "**Clue 3:** Personality traits associated with the species are {0}",
+    ),
+
+    # HORSES: 1: Country, Continent, Creation, Uses | 2: Color, Weight, Height | 3: Distinguishing Features
+    ("Horses", 1): (
+        (("Country", "unknown"), ("Continent", "unknown"), ("Creation", "unknown time"), ("Uses", "various uses")),
+        "**Clue 1:** This species was bred in {0}, {1} around {2}. Current uses include {3}",
+    ),
+    ("Horses", 2): (
+        (("Color", "various colors"), ("Weight", "unknown weight"), ("Height", "unknown height")),
+        "**Clue 2:** This species is often found in color(s): {0}, and typical weight ranges are {1} & height ranges are {2}",
+    ),
+    ("Horses", 3): (
+        (("Distinguishing Features", "varied features"),),
+        "**Clue 3:** Distinguishing features associated with this species are: {0}",
+    ),
+
+    # DINOSAURS: 1: Locations Found, Eating Habits | 2: Rough Size, Clade | 3: Social Behavior
+    ("Dinosaurs", 1): (
+        (("Locations Found", "unknown locations"), ("Eating Habits", "unknown diet")),
+        "**Clue 1:** This species was found in {0} and is a {1}",
+    ),
+    ("Dinosaurs", 2): (
+        (("Rough Size", "unknown size"), ("Clade", "unknown clade")),
+        "**Clue 2:** This species has size of roughly {0} and in the Clade {1}",
+    ),
+    ("Dinosaurs", 3): (
+        (("Social Behavior", "unknown behavior"),),
+        "**Clue 3:** Social behaviors associated are: {0}",
+    ),
+}
+
+def render_clue(category: str, clue_number: int, row: dict) -> str:
+    """Fill the CLUE_SPECS template for one row (used when building deck tables)."""
+    fields, template = CLUE_SPECS[(category, clue_number)]
+    return template.format(*[row.get(field, default) for field, default in fields])
+
 def build_composite_clue(state: dict, clue_number: int) -> str:
     """
-    Build a composite clue combining multiple dataset fields into natural language.
+    Look up a composite clue combining multiple dataset fields into natural language.
+    Clues are rendered for every row at load time, so this is a list index.
 
     Args:
-        state: Current game state containing category and row data
+        state: Current game state containing category and row id
         clue_number: Which clue to build (1, 2, or 3)
 
     Returns:
         Formatted clue string with category-specific field combinations
     """
-    category = state["category"]
-    row = state["row"]
-
-    # DOGS: Clue structure
-    # 1: Country, Continent, Creation Time, Use
-    # 2: Color
-    # 3: Personality Traits
-    if category == "Dogs":
-        if clue_number == 1:
-            country = safe_str(row.get("Country", "unknown"))
-            continent = safe_str(row.get("Continent", "unknown"))
-            creation = safe_str(row.get("Creation Time", "unknown time"))
-            use = safe_str(row.get("Use", "various purposes"))
-            return f"**Clue 1:** This species was bred in {country}, {continent} during the {creation} for use(s) like {use}"
-        elif clue_number == 2:
-            color = safe_str(row.get("Color", "various colors"))
-            return f"**Clue 2:** This species is often found in colors: {color}"
-        elif clue_number == 3:
-            personality = safe_str(row.get("Personality Traits", "varied traits"))
-            return f"**Clue 3:** Personality traits associated with the species are {personality}"
-
-    # CATS: Clue structure
-    # 1: Country, Continent, History
-    # 2: Color
-    # 3: Personality
-    elif category == "Cats":
-        if clue_number == 1:
-            country = safe_str(row.get("Country", "unknown"))
-            continent = safe_str(row.get("Continent", "unknown"))
-            history = safe_str(row.get("History", "unknown history"))
-            return f"**Clue 1:** This species was bred in {country}, {continent} and a tidbit of its history: {history}"
-        elif clue_number == 2:
-            color = safe_str(row.get("Color", "various colors"))
-            return f"**Clue 2:** This species is often found in colors: {color}"
-        elif clue_number == 3:
-            personality = safe_str(row.get("Personality", "varied traits"))
-            return f"**Clue 3:** Personality traits associated with the species are {personality}"
-
-    # HORSES: Clue structure
-    # 1: Country, Continent, Creation, Uses
-    # 2: Color, Weight, Height
-    # 3: Distinguishing Features
-    elif category == "Horses":
-        if clue_number == 1:
-            country = safe_str(row.get("Country", "unknown"))
-            continent = safe_str(row.get("Continent", "unknown"))
-            creation = safe_str(row.get("Creation", "unknown time"))
-            uses = safe_str(row.get("Uses", "various uses"))
-            return f"**Clue 1:** This species was bred in {country}, {continent} around {creation}. Current uses include {uses}"
-        elif clue_number == 2:
-            color = safe_str(row.get("Color", "various colors"))
-            weight = safe_str(row.get("Weight", "unknown weight"))
-            height = safe_str(row.get("Height", "unknown height"))
-            return f"**Clue 2:** This species is often found in color(s): {color}, and typical weight ranges are {weight} & height ranges are {height}"
-        elif clue_number == 3:
-            features = safe_str(row.get("Distinguishing Features", "varied features"))
-            return f"**Clue 3:** Distinguishing features associated with this species are: {features}"
-
-    # DINOSAURS: Clue structure
-    # 1: Locations Found, Eating Habits
-    # 2: Rough Size, Clade
-    # 3: Social Behavior
-    elif category == "Dinosaurs":
-        if clue_number == 1:
-            locations = safe_str(row.get("Locations Found", "unknown locations"))
-            eating = safe_str(row.get("Eating Habits", "unknown diet"))
-            return f"**Clue 1:** This species was found in {locations} and is a {eating}"
-        elif clue_number == 2:
-            size = safe_str(row.get("Rough Size", "unknown size"))
-            clade = safe_str(row.get("Clade", "unknown clade"))
-            return f"**Clue 2:** This species has size of roughly {size} and in the Clade {clade}"
-        elif clue_number == 3:
-            social = safe_str(row.get("Social Behavior", "unknown behavior"))
-            return f"**Clue 3:** Social behaviors associated are: {social}"
-
-    return "Clue information unavailable"
+    if not 1 <= clue_number <= MAX_CLUES:
+        return "Clue information unavailable"
+
+    return get_deck_tables()[state["category"]]["clue_strings"][clue_number - 1][state["row_id"]]
 
 def next_clue_text(state: dict) -> str:
     """
@@ -246,13 +310,13 @@ def build_all_clues_md(state: dict) -> str:
     """
     Build markdown showing all 3 composite clues for the final fact card.
     Shows what the user learned (or could have learned) during the round.
+    Built once per round and cached in state (clues are fixed per row).
     """
-    lines = ["### All Clues"]
-    for i in range(MAX_CLUES):
-        # Temporarily set clue_index to generate each clue
-        clue = build_composite_clue(state, i + 1)
-        lines.append(clue)
-    return "\n".join(lines)
+    if "all_clues_md" not in state:
+        state["all_clues_md"] = "### All Clues\n" + "\n".join(
+            build_composite_clue(state, i + 1) for i in range(MAX_CLUES)
+        )
+    return state["all_clues_md"]
 
 # def fact_card_md(state: dict) -> str:
 #     """
@@ -260,7 +324,7 @@ def build_all_clues_md(state: dict) -> str:
 #     Includes: Answer, all 3 clues, and image URL.
 #     """
 #     category = state["category"]
-#     row = state["row"]
+#     row = get_deck_tables()[category]["rows"][state["row_id"]]
 #     answer_col = ANSWER_FIELD[category]
 #     answer = safe_str(row.get(answer_col, ""))
 
@@ -295,16 +359,28 @@ def points_for_clues_used(clues_used: int) -> int:
 # Game state helpers
 # ----------------------------
 
+MSG_NO_CATEGORY = "Pick a category and click **New Round** first."
+MSG_ROUND_OVER = "That round is already over. Click **New Round** to play again."
+
 def is_game_active(state: dict) -> bool:
     """Check if a round is currently in progress."""
     return (state and
             "category" in state and
             not state.get("round_over", False))
 
+def inactive_round_msg(state: dict) -> str:
+    """Message shown when a button is used outside an active round."""
+    return MSG_ROUND_OVER if state and "category" in state else MSG_NO_CATEGORY
+
 # ----------------------------
 # Event handlers
 # ----------------------------
 
+# Shared visibility updates. Gradio only strips None entries and pops "value"
+# from update dicts, so these value-free dicts are safe to reuse across calls.
+SHOW = gr.update(visible=True)
+HIDE = gr.update(visible=False)
+
 def start_round(category: str, state: dict | None):
     """
     Initialize a new round:
@@ -318,14 +394,15 @@ def start_round(category: str, state: dict | None):
     prev_score = (state or {}).get("score", 0)
     prev_streak = (state or {}).get("streak", 0)
 
-    row = pick_round_row(category)
-    correct = safe_str(row.get(ANSWER_FIELD[category], ""))
+    row_id = pick_round_row(category)
+    row = get_deck_tables()[category]["rows"][row_id]
+    correct = row.get(ANSWER_FIELD[category], "")
     options = make_options(category, correct, n_options=4)
     img_url = get_example_image(row)
 
     state = {
         "category": category,
-        "row": row,
+        "row_id": row_id,
         "guess_count": 0, 
         "answer": correct,
         "options": options,
@@ -356,20 +433,22 @@ def start_round(category: str, state: dict | None):
         gr.update(choices=options, value=None, visible=True),  # Show options
         build_score_text(state),
         gr.update(value=img_html, visible=False),  # Set image HTML but keep hidden
-        gr.update(visible=True),   # Show Hint button
-        gr.update(visible=True),   # Show Give up button
-        gr.update(visible=True),   # Show Submit button
+        SHOW,   # Show Hint button
+        SHOW,   # Show Give up button
+        SHOW,   # Show Submit button
     )
 
 def give_hint(chat: list, state: dict):
     """Reveal next composite clue."""
     if not is_game_active(state):
-        msg = "Pick a category and click **New Round** first." if not state or "category" not in state else "That round is already over. Click **New Round** to play again."
-        chat = (chat or []) + [as_msg("assistant", msg)]
-        return chat, state
+        msg = inactive_round_msg(state)
+        chat = list(chat or [])
+        chat.append(as_msg("assistant", msg))
+        return chat, gr.skip()
 
     clue = next_clue_text(state)
-    chat = (chat or []) + [as_msg("assistant", clue)]
+    chat = list(chat or [])
+    chat.append(as_msg("assistant", clue))
     return chat, state
 
 def submit_guess(selected: str, chat: list, state: dict):
@@ -379,16 +458,19 @@ def submit_guess(selected: str, chat: list, state: dict):
     - Wrong: Reset streak, allow retry
     """
     if not is_game_active(state):
-        msg = "Pick a category and click **New Round** first." if not state or "category" not in state else "That round is already over. Click **New Round** to play again."
-        chat = (chat or []) + [as_msg("assistant", msg)]
-        return chat, state, build_score_text(state or {}), gr.update(), gr.update(), gr.update(), gr.update()
+        msg = inactive_round_msg(state)
+        chat = list(chat or [])
+        chat.append(as_msg("assistant", msg))
+        return chat, gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip()
 
     if not selected:
-        chat = (chat or []) + [as_msg("assistant", "Choose one of the options first, then click **Submit Guess**.")]
-        return chat, state, build_score_text(state), gr.update(), gr.update(), gr.update(), gr.update()
+        chat = list(chat or [])
+        chat.append(as_msg("assistant", "Choose one of the options first, then click **Submit Guess**."))
+        return chat, gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip()
 
     correct = state["answer"]
-    chat = (chat or []) + [as_msg("user", f"My guess: {selected}")]
+    chat = list(chat or [])
+    chat.append(as_msg("user", f"My guess: {selected}"))
     state["guess_count"] = state.get("guess_count", 0) + 1                                                                                                        
 
 
@@ -402,7 +484,7 @@ def submit_guess(selected: str, chat: list, state: dict):
         state["streak"] = state.get("streak", 0) + 1
         state["round_over"] = True
 
-        chat = chat + [
+        chat.append(
             as_msg(
                 "assistant",
                 f"✅ Correct! **{correct}**\n\n"
@@ -410,23 +492,23 @@ def submit_guess(selected: str, chat: list, state: dict):
 #                f"{fact_card_md(state)}\n\n"
                 "Click **New Round** to play again."
             )
-        ]
+        )
 
         # Show image now that round is over
         return (
             chat,
             state,
             build_score_text(state),
-            gr.update(visible=True),  # Show image (value already set)
-            gr.update(visible=False),  # Hide Hint button
-            gr.update(visible=False),  # Hide Give up button
-            gr.update(),  # Submit button remains visible
+            SHOW,  # Show image (value already set)
+            HIDE,  # Hide Hint button
+            HIDE,  # Hide Give up button
+            gr.skip(),  # Submit button remains visible
         )
 
-    # Wrong answer
+    # Wrong answer (image and buttons untouched, so skip them entirely)
     state["streak"] = 0
-    chat = chat + [as_msg("assistant", "Not quite. Click **Hint** for another clue, or guess again.")]
-    return chat, state, build_score_text(state), gr.update(), gr.update(), gr.update(), gr.update()
+    chat.append(as_msg("assistant", "Not quite. Click **Hint** for another clue, or guess again."))
+    return chat, state, build_score_text(state), gr.skip(), gr.skip(), gr.skip(), gr.skip()
 
 def give_up(chat: list, state: dict):
     """
@@ -434,31 +516,33 @@ def give_up(chat: list, state: dict):
     Shows image and all clues for educational value.
     """
     if not is_game_active(state):
-        msg = "Pick a category and click **Start / New Round** first." if not state or "category" not in state else "That round is already over. Click **New Round** to play again."
-        chat = (chat or []) + [as_msg("assistant", msg)]
-        return chat, state, build_score_text(state or {}), gr.update(), gr.update(), gr.update(), gr.update()
+        msg = inactive_round_msg(state)
+        chat = list(chat or [])
+        chat.append(as_msg("assistant", msg))
+        return chat, gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip(), gr.skip()
 
     state["round_over"] = True
     state["streak"] = 0
 
-    chat = (chat or []) + [
+    chat = list(chat or [])
+    chat.append(
         as_msg(
             "assistant",
             f"All good — the answer was **{state['answer']}**.\n\n"
 #            f"{fact_card_md(state)}\n\n"
             "Click **New Round** when you're ready."
         )
-    ]
+    )
 
     # Show image now that round is over
     return (
         chat,
         state,
         build_score_text(state),
-        gr.update(visible=True),  # Show image (value already set)
-        gr.update(visible=False),  # Hide Hint button
-        gr.update(visible=False),  # Hide Give up button
-        gr.update(),  # Submit button remains visible
+        SHOW,  # Show image (value already set)
+        HIDE,  # Hide Hint button
+        HIDE,  # Hide Give up button
+        gr.skip(),  # Submit button remains visible
     )
 
 # ----------------------------
@@ -544,7 +628,8 @@ with gr.Blocks(title="Three Clues: Animal ID Game") as demo:
         outputs=[chat, state, score_md, image, hint_btn, giveup_btn, submit_btn],
     )
 
-demo.queue()
+# Bound concurrent handler runs and pending requests; Gradio>=4.15 also throttles UI updates client-side
+demo.queue(default_concurrency_limit=8, max_size=64)
 demo.launch(css="""
     #submit-guess-btn {
         background: linear-gradient(to right, #10b981, #059669) !important;